@@ -4,11 +4,29 @@ Telegram Webhook Manager
 Utility to manage webhook configuration for your Telegram bot
 """
 
+import http.client
+import json
 import os
 import sys
-import requests
+import time
+from functools import lru_cache
+from pathlib import Path
+
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+TELEGRAM_API_HOST = "api.telegram.org"
+REQUEST_TIMEOUT = 10
+DEFAULT_CACHE_FILE = "~/.cache/tg-webhook-manager.json"
+DEFAULT_CACHE_TTL = 10
+
+# Shared connection so repeated menu actions reuse the same TLS session
+_CONNECTION = http.client.HTTPSConnection(TELEGRAM_API_HOST, timeout=REQUEST_TIMEOUT)
+
 
 def get_token():
     """Get bot token from environment"""
@@ -20,32 +38,135 @@ def get_token():
     return token
 
 
+@lru_cache(maxsize=1)
+def get_base_path(token):
+    """Build the Bot API base path for a token"""
+    return f"/bot{token}"
+
+
+def parse_response(body):
+    """Decode a JSON response body, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # orjson rejects invalid UTF-8 and lone surrogates
+            pass
+    return json.loads(body.decode("utf-8", "replace"))
+
+
+def call_api(token, method, payload=None):
+    """Call a Bot API method over the shared connection"""
+    path = f"{get_base_path(token)}/{method}"
+    if payload is None:
+        http_method, body, headers = "GET", None, {}
+    else:
+        http_method = "POST"
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json"}
+
+    try:
+        _CONNECTION.request(http_method, path, body=body, headers=headers)
+        response = _CONNECTION.getresponse()
+    except (http.client.HTTPException, ConnectionError):
+        # Telegram may drop idle keep-alive connections; reconnect once
+        _CONNECTION.close()
+        _CONNECTION.request(http_method, path, body=body, headers=headers)
+        response = _CONNECTION.getresponse()
+    return parse_response(response.read())
+
+
 def get_webhook_info(token):
     """Get current webhook information"""
-    url = f"https://api.telegram.org/bot{token}/getWebhookInfo"
-    response = requests.get(url)
-    return response.json()
+    return call_api(token, "getWebhookInfo")
 
 
 def set_webhook(token, webhook_url):
     """Set webhook URL"""
-    url = f"https://api.telegram.org/bot{token}/setWebhook"
-    response = requests.post(url, json={"url": webhook_url})
-    return response.json()
+    return call_api(token, "setWebhook", {"url": webhook_url})
 
 
 def delete_webhook(token):
     """Delete webhook (return to polling mode)"""
-    url = f"https://api.telegram.org/bot{token}/deleteWebhook"
-    response = requests.post(url)
-    return response.json()
+    return call_api(token, "deleteWebhook", {})
+
+
+def get_cache_file():
+    """Get the webhook info cache file path"""
+    return Path(os.getenv('WEBHOOK_INFO_CACHE_FILE', DEFAULT_CACHE_FILE)).expanduser()
+
+
+def read_cached_info(token):
+    """Read cached webhook info as (timestamp, info), or None"""
+    try:
+        cached = json.loads(get_cache_file().read_text())
+        if cached.get('bot_id') != token.split(':')[0]:
+            return None
+        ts, body = cached['ts'], cached['body']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if not isinstance(ts, (int, float)) or not isinstance(body, dict):
+        return None
+    return ts, body
+
+
+def write_cached_info(token, info):
+    """Store webhook info in the cache file"""
+    cache_file = get_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({
+            "ts": time.time(),
+            "bot_id": token.split(':')[0],
+            "body": info,
+        }))
+    except OSError:
+        pass
+
+
+def clear_cached_info():
+    """Remove the cached webhook info"""
+    try:
+        get_cache_file().unlink()
+    except OSError:
+        pass
+
 
+def get_webhook_info_cached(token):
+    """Get webhook info, using the cache when fresh or Telegram is unavailable
 
-def print_webhook_info(info):
+    Returns a tuple of (info, is_stale)
+    """
+    try:
+        ttl = float(os.getenv('WEBHOOK_INFO_CACHE_TTL', DEFAULT_CACHE_TTL))
+    except ValueError:
+        ttl = DEFAULT_CACHE_TTL
+    cached = read_cached_info(token)
+    if cached and time.time() - cached[0] < ttl:
+        return cached[1], False
+
+    try:
+        info = get_webhook_info(token)
+    except (OSError, http.client.HTTPException, ValueError):
+        if cached:
+            return cached[1], True
+        raise
+
+    if not info.get('ok'):
+        # Error responses such as 429 rate limits carry no webhook info
+        if cached:
+            return cached[1], True
+        return info, False
+
+    write_cached_info(token, info)
+    return info, False
+
+
+def print_webhook_info(info, stale=False):
     """Pretty print webhook information"""
     result = info.get('result', {})
     
-    print("\n📊 Current Webhook Status:")
+    print(f"\n📊 Current Webhook Status{' [stale]' if stale else ''}:")
     print("=" * 60)
     print(f"URL: {result.get('url', 'Not set')}")
     print(f"Has Custom Certificate: {result.get('has_custom_certificate', False)}")
@@ -85,8 +206,11 @@ def main():
         
         if choice == "1":
             print("\n🔍 Fetching webhook info...")
-            info = get_webhook_info(token)
-            print_webhook_info(info)
+            info, stale = get_webhook_info_cached(token)
+            if info.get('ok'):
+                print_webhook_info(info, stale)
+            else:
+                print(f"❌ Error: {info.get('description', 'Unknown error')}")
             
         elif choice == "2":
             webhook_url = input("\nEnter webhook URL (with https://): ").strip()
@@ -100,6 +224,7 @@ def main():
             
             print(f"\n🔧 Setting webhook to: {webhook_url}")
             result = set_webhook(token, webhook_url)
+            clear_cached_info()
             
             if result.get('ok'):
                 print("✅ Webhook set successfully!")
@@ -112,6 +237,7 @@ def main():
             if confirm.lower() in ['yes', 'y']:
                 print("\n🗑️  Deleting webhook...")
                 result = delete_webhook(token)
+                clear_cached_info()
                 
                 if result.get('ok'):
                     print("✅ Webhook deleted successfully!")
@@ -147,4 +273,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
+    finally:
+        _CONNECTION.close()
 
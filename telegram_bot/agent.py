@@ -55,15 +55,16 @@ class AgentManager:
         """
         vertexai.init(project=config.project_id, location=config.location)
         logger.info(
-            f"Initialized Vertex AI with project: {config.project_id}, "
-            f"location: {config.location}"
+            "Initialized Vertex AI with project: %s, location: %s",
+            config.project_id,
+            config.location,
         )
 
         try:
             self._agent = agent_engines.get(config.agent_id)
-            logger.info(f"Successfully loaded agent: {config.agent_id}")
+            logger.info("Successfully loaded agent: %s", config.agent_id)
         except Exception as e:
-            logger.error(f"Failed to load agent: {e}")
+            logger.error("Failed to load agent: %s", e)
             raise
 
 
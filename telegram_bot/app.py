@@ -5,19 +5,36 @@ This is the main entry point for the bot application.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import logging
+import sys
 from typing import Any
 
 from dotenv import load_dotenv
 from telegram.ext import ApplicationBuilder
 
 from agent import agent_manager
-from config import BotConfig, load_bot_config, load_vertex_ai_config
+from config import (
+    CONNECT_TIMEOUT,
+    GET_UPDATES_CONNECTION_POOL_SIZE,
+    HTTP_VERSION,
+    MAX_CONCURRENT_UPDATES,
+    READ_TIMEOUT,
+    WEBHOOK_MAX_CONNECTIONS,
+    WEBHOOK_URL_PATH,
+    BotConfig,
+    load_bot_config,
+    load_vertex_ai_config,
+)
 from handlers import setup_handlers
+from json_request import OrjsonRequest
+from update_processor import PerUserUpdateProcessor
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once per process tree)
+if os.getenv('DOTENV_LOADED') != '1':
+    load_dotenv()
+    os.environ['DOTENV_LOADED'] = '1'
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +44,19 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Use uvloop when available; must be set before the application creates its loop.
+# Event loop policies are deprecated as of Python 3.14, so newer interpreters
+# keep the default asyncio loop until PTB can be given a loop factory.
+uvloop_enabled = False
+if sys.version_info < (3, 14):
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        uvloop_enabled = True
+
 
 def run_webhook_mode(
     application: Any,
@@ -38,11 +68,16 @@ def run_webhook_mode(
     """
     port = int(os.environ.get("PORT", "8080"))
     listen = "0.0.0.0"
+    logger.info("Starting bot in WEBHOOK mode")
+    logger.info("Webhook URL: %s", config.full_webhook_url)
+    logger.info("Port: %s", port)
     # run_webhook will start the HTTP server and set the webhook with Telegram API if webhook_url provided.
     application.run_webhook(
         listen=listen,
         port=port,
-        webhook_url=config.webhook_url,
+        url_path=WEBHOOK_URL_PATH,
+        webhook_url=config.full_webhook_url,
+        max_connections=WEBHOOK_MAX_CONNECTIONS,
     )
 
 
@@ -58,6 +93,8 @@ def run_polling_mode(application: Any) -> None:
 
 def main() -> None:
     """Main entry point for the bot."""
+    logger.info("Using event loop: %s", "uvloop" if uvloop_enabled else "asyncio")
+
     # Load configurations
     bot_config = load_bot_config()
     vertex_ai_config = load_vertex_ai_config()
@@ -66,11 +103,32 @@ def main() -> None:
     try:
         agent_manager.initialize(vertex_ai_config)
     except Exception as e:
-        logger.error(f"Failed to initialize Vertex AI: {e}")
+        logger.error("Failed to initialize Vertex AI: %s", e)
         raise
 
     # Build application
-    application = ApplicationBuilder().token(bot_config.token).build()
+    application = (
+        ApplicationBuilder()
+        .token(bot_config.token)
+        .request(
+            OrjsonRequest(
+                connection_pool_size=bot_config.connection_pool_size,
+                pool_timeout=bot_config.pool_timeout,
+                connect_timeout=CONNECT_TIMEOUT,
+                read_timeout=READ_TIMEOUT,
+                http_version=HTTP_VERSION,
+            )
+        )
+        .get_updates_request(
+            OrjsonRequest(
+                connection_pool_size=GET_UPDATES_CONNECTION_POOL_SIZE,
+                pool_timeout=bot_config.pool_timeout,
+                http_version=HTTP_VERSION,
+            )
+        )
+        .concurrent_updates(PerUserUpdateProcessor(MAX_CONCURRENT_UPDATES))
+        .build()
+    )
 
     # Setup handlers
     setup_handlers(application)
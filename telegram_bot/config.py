@@ -5,27 +5,45 @@ from __future__ import annotations
 import os
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Constants
 DEFAULT_LOCATION = 'us-central1'
 DEFAULT_PORT = 8080
 DEFAULT_MODE = 'polling'
+WEBHOOK_URL_PATH = 'webhook'
+# Larger pools keep more sockets open to the Bot API, which it tolerates well,
+# and avoid handlers stalling on "connection pool is occupied" under load
+DEFAULT_CONNECTION_POOL_SIZE = 256
+DEFAULT_POOL_TIMEOUT = 30.0
+GET_UPDATES_CONNECTION_POOL_SIZE = 64
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 30.0
+HTTP_VERSION = '2'
+MAX_CONCURRENT_UPDATES = 256
+WEBHOOK_MAX_CONNECTIONS = 100
 TERMINATE_KEYWORD = 'TERMINATE'
 TYPING_ACTION = 'typing'
+SESSION_CACHE_MAXSIZE = 1000
+SESSION_CACHE_TTL_SECONDS = 1800
+SESSION_CACHE_LOG_INTERVAL = 100
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BotConfig:
     """Configuration for the Telegram bot."""
 
     token: str
     mode: str
     webhook_url: str
+    full_webhook_url: str
     port: int
     webhook_path: str
+    connection_pool_size: int
+    pool_timeout: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VertexAIConfig:
     """Configuration for Vertex AI."""
 
@@ -34,9 +52,12 @@ class VertexAIConfig:
     agent_id: str
 
 
+@lru_cache(maxsize=1)
 def load_bot_config() -> BotConfig:
     """Load bot configuration from environment variables.
 
+    The result is memoized; call ``load_bot_config.cache_clear()`` to reload.
+
     Returns:
         Bot configuration.
 
@@ -52,21 +73,35 @@ def load_bot_config() -> BotConfig:
 
     mode = os.getenv('BOT_MODE', DEFAULT_MODE).lower()
     webhook_url = os.getenv('WEBHOOK_URL', '')
+    full_webhook_url = (
+        f"{webhook_url.rstrip('/')}/{WEBHOOK_URL_PATH}" if webhook_url else ''
+    )
     port = int(os.getenv('PORT', str(DEFAULT_PORT)))
     webhook_path = os.getenv('WEBHOOK_PATH', str(uuid.uuid4()))
+    connection_pool_size = int(
+        os.getenv('CONNECTION_POOL_SIZE', str(DEFAULT_CONNECTION_POOL_SIZE))
+    )
+    pool_timeout = float(os.getenv('POOL_TIMEOUT', str(DEFAULT_POOL_TIMEOUT)))
 
     return BotConfig(
         token=token,
         mode=mode,
         webhook_url=webhook_url,
+        full_webhook_url=full_webhook_url,
         port=port,
         webhook_path=webhook_path,
+        connection_pool_size=connection_pool_size,
+        pool_timeout=pool_timeout,
     )
 
 
+@lru_cache(maxsize=1)
 def load_vertex_ai_config() -> VertexAIConfig:
     """Load Vertex AI configuration from environment variables.
 
+    The result is memoized; call ``load_vertex_ai_config.cache_clear()`` to
+    reload.
+
     Returns:
         Vertex AI configuration.
 
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-from telegram import Update
+from telegram import MessageEntity, Update
 from telegram.ext import ContextTypes, MessageHandler, filters
 
 from agent import agent_manager
 from config import TERMINATE_KEYWORD
+from session_cache import session_cache
 from utils import (
     delete_session,
     extract_response_text,
@@ -34,14 +36,23 @@ async def handle_message(
         update: Telegram update object.
         context: Telegram context.
     """
+    # Resolve update properties once
+    effective_chat = update.effective_chat
+    effective_user = update.effective_user
+    message = update.message
+
     # Validate update
-    if not update.effective_chat or not update.message or not update.message.text:
+    if not effective_chat or not message or not message.text:
         logger.error("No chat ID or message text found in update")
         return
 
+    chat_id = effective_chat.id
+    user_id = effective_user.id if effective_user else 0
+    first_name = effective_user.first_name if effective_user else None
+    text = message.text
+
     # Check agent initialization
     if not agent_manager.is_initialized:
-        chat_id = get_chat_id(update)
         await send_message(
             context,
             chat_id,
@@ -50,28 +61,21 @@ async def handle_message(
         )
         return
 
-    user_id = get_user_id(update)
-    chat_id = get_chat_id(update)
-
-    # Initialize user_data if needed
-    if context.user_data is None:
-        context.user_data = {}
-
     # Check if session exists, create if not (start conversation)
-    session = context.user_data.get('session')
+    session = session_cache.get(str(user_id))
     is_first_message = False
 
-    if not session:
-        logger.info(f"Starting new conversation for user {user_id}")
+    if session is None:
+        logger.info("Starting new conversation for user %s", user_id)
         try:
             session = agent_manager.agent.create_session(user_id=str(user_id))
-            context.user_data['session'] = session
+            session_cache.set(str(user_id), session)
             is_first_message = True
             logger.info(
-                f"Created new session for user {user_id}: {session['id']}"
+                "Created new session for user %s: %s", user_id, session['id']
             )
         except Exception as e:
-            logger.error(f"Failed to create session: {e}")
+            logger.error("Failed to create session: %s", e)
             await send_message(
                 context,
                 chat_id,
@@ -80,35 +84,36 @@ async def handle_message(
             return
 
     # Prepare the message - add greeting for first message
-    user_message = prepare_user_message(
-        update.message.text,
-        is_first_message,
-        update.effective_user.first_name if update.effective_user else None,
-    )
+    user_message = prepare_user_message(text, is_first_message, first_name)
 
     if is_first_message:
-        logger.info(f"First message with greeting for user {user_id}")
+        logger.info("First message with greeting for user %s", user_id)
 
     try:
-        # Send typing indicator
-        await send_typing_action(context, chat_id)
+        # Send typing indicator while the agent is working
+        typing_task = asyncio.create_task(send_typing_action(context, chat_id))
 
-        logger.info(f"User {user_id} sent: {update.message.text}")
+        logger.info("User %s sent: %s", user_id, text)
 
         # Stream query the agent with session
-        events = agent_manager.agent.stream_query(
+        events = await asyncio.to_thread(
+            agent_manager.agent.stream_query,
             user_id=str(user_id),
             session_id=session['id'],
             message=user_message,
         )
-        response_text = extract_response_text(events)
+        response_text = await extract_response_text(events, TERMINATE_KEYWORD)
+        await typing_task
 
-        logger.info(f"Agent response to user {user_id}: {response_text[:100]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Agent response to user %s: %s...", user_id, response_text[:100]
+            )
 
         # Check if we got a response
         if not response_text:
             logger.warning(
-                f"No response text received from agent for user {user_id}"
+                "No response text received from agent for user %s", user_id
             )
             await send_message(
                 context,
@@ -118,9 +123,14 @@ async def handle_message(
             return
 
         # Check if response contains TERMINATE (end conversation)
-        if TERMINATE_KEYWORD in response_text:
+        before, keyword, after = response_text.partition(TERMINATE_KEYWORD)
+        if keyword:
+            # Only the remainder can hold further occurrences
+            clean_response = (
+                before + after.replace(TERMINATE_KEYWORD, "")
+            ).strip()
             await handle_terminate_response(
-                response_text,
+                clean_response,
                 context,
                 chat_id,
                 str(user_id),
@@ -132,7 +142,7 @@ async def handle_message(
         await send_message(context, chat_id, response_text)
 
     except Exception as e:
-        logger.error(f"Error querying agent: {e}", exc_info=True)
+        logger.error("Error querying agent: %s", e, exc_info=True)
         await send_message(
             context,
             chat_id,
@@ -157,17 +167,11 @@ async def handle_command(
     user_id = get_user_id(update)
     chat_id = get_chat_id(update)
 
-    # Clean up session from context if exists
-    session_exists = (
-        context.user_data is not None
-        and 'session' in context.user_data
-        and context.user_data.get('session')
-    )
+    # Clean up session if exists
+    session = session_cache.get(str(user_id))
 
-    if session_exists and context.user_data is not None:
-        session = context.user_data['session']
+    if session is not None:
         await delete_session(str(user_id), session['id'])
-        context.user_data.pop('session', None)
 
         await send_message(
             context,
@@ -183,20 +187,32 @@ async def handle_command(
         )
 
 
-def setup_handlers(application: Any) -> None:
-    """Configure bot handlers.
+async def dispatch_update(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> None:
+    """Route a text update to the command or message handler.
 
     Args:
-        application: Telegram application instance.
+        update: Telegram update object.
+        context: Telegram context.
     """
-    # Handle all text messages
-    message_handler = MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
-        handle_message,
+    message = update.effective_message
+    is_command = message is not None and any(
+        entity.type == MessageEntity.BOT_COMMAND and entity.offset == 0
+        for entity in message.entities
     )
-    application.add_handler(message_handler)
+    if is_command:
+        await handle_command(update, context)
+    else:
+        await handle_message(update, context)
 
-    # Handle commands (to end conversation)
-    command_handler = MessageHandler(filters.COMMAND, handle_command)
-    application.add_handler(command_handler)
 
+def setup_handlers(application: Any) -> None:
+    """Configure bot handlers.
+
+    Args:
+        application: Telegram application instance.
+    """
+    # Single handler for all text; commands end the conversation
+    application.add_handler(MessageHandler(filters.TEXT, dispatch_update))
@@ -0,0 +1,47 @@
+"""HTTP request backend with fast JSON decoding for Bot API responses."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from telegram.request import HTTPXRequest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonRequest(HTTPXRequest):
+    """HTTPX request that decodes Bot API responses with orjson.
+
+    Falls back to the standard library parser when orjson is not installed.
+    """
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict[str, Any]:
+        """Parse the JSON returned from Telegram.
+
+        orjson rejects invalid UTF-8 and lone surrogates, which the standard
+        parser accepts by replacing them, so such payloads are handed to it.
+
+        Args:
+            payload: UTF-8 encoded JSON payload.
+
+        Returns:
+            Parsed JSON object.
+
+        Raises:
+            TelegramError: If the payload is not valid JSON.
+        """
+        if orjson is None:
+            return HTTPXRequest.parse_json_payload(payload)
+
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.debug("orjson could not decode payload, using the standard parser")
+            return HTTPXRequest.parse_json_payload(payload)
@@ -0,0 +1,179 @@
+"""In-process store of active agent sessions keyed by user ID."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from agent import agent_manager
+from config import (
+    SESSION_CACHE_LOG_INTERVAL,
+    SESSION_CACHE_MAXSIZE,
+    SESSION_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """LRU cache of agent sessions with a sliding time to live.
+
+    This is the only place active sessions are kept, so a session that
+    stays idle past the TTL or is evicted ends that user's conversation.
+    Each lookup refreshes the entry, so entries stay ordered by last use.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SESSION_CACHE_MAXSIZE,
+        ttl_seconds: float = SESSION_CACHE_TTL_SECONDS,
+        log_interval: int = SESSION_CACHE_LOG_INTERVAL,
+        on_evict: Callable[[str, Any], None] | None = None,
+    ) -> None:
+        """Initialize the session cache.
+
+        Args:
+            maxsize: Maximum number of sessions kept in memory.
+            ttl_seconds: Seconds a session may stay unused before it expires.
+            log_interval: Number of lookups between hit/miss log lines.
+            on_evict: Called with the user ID and session of every entry
+                that expires or is evicted, but not of invalidated ones.
+        """
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._log_interval = log_interval
+        self._on_evict = on_evict
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached sessions."""
+        return len(self._entries)
+
+    def get(self, user_id: str) -> Any | None:
+        """Get the cached session for a user.
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            The cached session, or None if missing or expired.
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self._record(hit=False)
+            return None
+
+        session = entry[1]
+        self._entries[user_id] = (now, session)
+        self._entries.move_to_end(user_id)
+        self._record(hit=True)
+        return session
+
+    def set(self, user_id: str, session: Any) -> None:
+        """Cache a session for a user, evicting the least recently used.
+
+        Args:
+            user_id: User ID.
+            session: Session to cache.
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        self._entries[user_id] = (now, session)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._maxsize:
+            self._evict(*self._entries.popitem(last=False))
+
+    def invalidate(self, user_id: str) -> None:
+        """Remove the cached session for a user.
+
+        Args:
+            user_id: User ID.
+        """
+        self._entries.pop(user_id, None)
+
+    def _evict_expired(self, now: float) -> None:
+        """Evict entries unused for longer than the TTL.
+
+        Entries are ordered by last use, so expired ones form a prefix.
+
+        Args:
+            now: Current monotonic time.
+        """
+        while self._entries:
+            last_used = next(iter(self._entries.values()))[0]
+            if now - last_used < self._ttl_seconds:
+                break
+            self._evict(*self._entries.popitem(last=False))
+
+    def _evict(self, user_id: str, entry: tuple[float, Any]) -> None:
+        """Notify the eviction callback about a removed entry.
+
+        Args:
+            user_id: User ID.
+            entry: Removed (last used, session) entry.
+        """
+        if self._on_evict is not None:
+            self._on_evict(user_id, entry[1])
+
+    def _record(self, hit: bool) -> None:
+        """Update hit/miss counters and periodically log them.
+
+        Args:
+            hit: Whether the lookup was a cache hit.
+        """
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        lookups = self.hits + self.misses
+        if self._log_interval and lookups % self._log_interval == 0:
+            logger.info(
+                "Session cache: %d hits, %d misses, %d entries",
+                self.hits,
+                self.misses,
+                len(self._entries),
+            )
+
+
+def _delete_remote_session(user_id: str, session_id: str) -> None:
+    """Delete a session from the agent engine.
+
+    Args:
+        user_id: User ID.
+        session_id: Session ID to delete.
+    """
+    try:
+        agent_manager.agent.delete_session(user_id=user_id, session_id=session_id)
+        logger.info("Deleted expired session for user %s", user_id)
+    except Exception as e:
+        logger.warning("Error deleting expired session: %s", e)
+
+
+def end_evicted_session(user_id: str, session: Any) -> None:
+    """Delete an expired or evicted session without blocking the event loop.
+
+    Args:
+        user_id: User ID.
+        session: Evicted session.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _delete_remote_session(user_id, session['id'])
+    else:
+        loop.run_in_executor(None, _delete_remote_session, user_id, session['id'])
+
+
+# Global session cache instance
+session_cache = SessionCache(on_evict=end_evicted_session)
@@ -0,0 +1,81 @@
+"""Update processor that keeps each user's updates in order."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """Process updates concurrently across users but sequentially per user.
+
+    Updates without an effective user are processed without waiting.
+    """
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        """Initialize the update processor.
+
+        Args:
+            max_concurrent_updates: Maximum number of updates processed at once.
+        """
+        super().__init__(max_concurrent_updates)
+        self._locks: dict[int, asyncio.Lock] = {}
+        # Number of updates holding or awaiting each user's lock
+        self._pending: dict[int, int] = {}
+
+    async def process_update(  # type: ignore[misc]
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        """Wait for earlier updates from the same user, then process the update.
+
+        The per-user lock is taken before the concurrency semaphore, so updates
+        queued behind a busy user do not hold slots other users could use.
+
+        Args:
+            update: Update to process.
+            coroutine: Coroutine processing the update.
+        """
+        user = update.effective_user if isinstance(update, Update) else None
+        if user is None:
+            await super().process_update(update, coroutine)
+            return
+
+        user_id = user.id
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = self._locks[user_id] = asyncio.Lock()
+        self._pending[user_id] = self._pending.get(user_id, 0) + 1
+
+        try:
+            async with lock:
+                await super().process_update(update, coroutine)
+        finally:
+            self._pending[user_id] -= 1
+            if not self._pending[user_id]:
+                del self._pending[user_id]
+                del self._locks[user_id]
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        """Process the update.
+
+        Args:
+            update: Update to process.
+            coroutine: Coroutine processing the update.
+        """
+        await coroutine
+
+    async def initialize(self) -> None:
+        """Initialize the processor."""
+
+    async def shutdown(self) -> None:
+        """Shut down the processor."""
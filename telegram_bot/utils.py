@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -9,7 +10,8 @@ from telegram import Update
 from telegram.ext import ContextTypes
 
 from agent import agent_manager
-from config import TERMINATE_KEYWORD, TYPING_ACTION
+from config import TYPING_ACTION
+from session_cache import session_cache
 
 logger = logging.getLogger(__name__)
 
@@ -64,11 +66,16 @@ async def send_typing_action(
 ) -> None:
     """Send typing action to a chat.
 
+    Failures are logged and ignored, since the indicator is cosmetic.
+
     Args:
         context: Telegram context.
         chat_id: Chat ID to send action to.
     """
-    await context.bot.send_chat_action(chat_id=chat_id, action=TYPING_ACTION)
+    try:
+        await context.bot.send_chat_action(chat_id=chat_id, action=TYPING_ACTION)
+    except Exception as e:
+        logger.warning("Error sending typing action: %s", e)
 
 
 def prepare_user_message(
@@ -93,22 +100,56 @@ def prepare_user_message(
     return f"Hello, my name is {full_name}. {message_text}"
 
 
-def extract_response_text(events: Any) -> str:
-    """Extract text from agent response events.
+def _drain_events(events: Any, stop_token: str | None = None) -> str:
+    """Consume agent response events and collect their text.
 
     Args:
         events: Stream of events from agent.
+        stop_token: Optional token that ends consumption once seen.
 
     Returns:
         Concatenated response text.
     """
-    response_text = ""
+    parts: list[str] = []
+    # Trailing text of previous parts, so a token split across parts is found
+    tail = ""
     for event in events:
-        if "content" in event and "parts" in event["content"]:
-            for part in event["content"]["parts"]:
-                if "text" in part:
-                    response_text += part["text"]
-    return response_text
+        content = event.get("content")
+        if not content:
+            continue
+        for part in content.get("parts", ()):
+            text = part.get("text")
+            if not text:
+                continue
+            parts.append(text)
+            if stop_token:
+                window = tail + text
+                if stop_token in window:
+                    close = getattr(events, "close", None)
+                    if close is not None:
+                        close()
+                    return "".join(parts)
+                tail = window[-len(stop_token):]
+    return "".join(parts)
+
+
+async def extract_response_text(
+    events: Any,
+    stop_token: str | None = None,
+) -> str:
+    """Extract text from agent response events.
+
+    The stream is consumed in a worker thread so the blocking agent
+    call does not stall the event loop for other users.
+
+    Args:
+        events: Stream of events from agent.
+        stop_token: Optional token that stops reading the stream once seen.
+
+    Returns:
+        Concatenated response text.
+    """
+    return await asyncio.to_thread(_drain_events, events, stop_token)
 
 
 async def delete_session(
@@ -121,18 +162,19 @@ async def delete_session(
         user_id: User ID.
         session_id: Session ID to delete.
     """
+    session_cache.invalidate(user_id)
     try:
         agent_manager.agent.delete_session(
             user_id=user_id,
             session_id=session_id,
         )
-        logger.info(f"Deleted session for user {user_id}")
+        logger.info("Deleted session for user %s", user_id)
     except Exception as e:
-        logger.warning(f"Error deleting session: {e}")
+        logger.warning("Error deleting session: %s", e)
 
 
 async def handle_terminate_response(
-    response_text: str,
+    clean_response: str,
     context: ContextTypes.DEFAULT_TYPE,
     chat_id: int,
     user_id: str,
@@ -141,24 +183,17 @@ async def handle_terminate_response(
     """Handle TERMINATE keyword in response.
 
     Args:
-        response_text: Agent response text.
+        clean_response: Agent response text with TERMINATE removed.
         context: Telegram context.
         chat_id: Chat ID.
         user_id: User ID.
         session_id: Session ID.
     """
-    logger.info(f"TERMINATE detected - ending conversation for user {user_id}")
-
-    # Remove TERMINATE from the response before sending
-    clean_response = response_text.replace(TERMINATE_KEYWORD, "").strip()
+    logger.info("TERMINATE detected - ending conversation for user %s", user_id)
 
     if clean_response:
         await send_message(context, chat_id, clean_response)
 
-    # Clean up session
+    # Clean up session (also drops it from the session cache)
     await delete_session(user_id, session_id)
 
-    # Remove session from context
-    if context.user_data:
-        context.user_data.pop('session', None)
-
@@ -0,0 +1,26 @@
+"""Tests for the orjson request backend."""
+
+from __future__ import annotations
+
+import pytest
+from telegram.error import TelegramError
+
+from json_request import OrjsonRequest
+
+
+def test_parses_valid_payload():
+    assert OrjsonRequest.parse_json_payload(b'{"ok": true}') == {'ok': True}
+
+
+def test_accepts_payload_rejected_by_orjson():
+    payload = b'{"ok": true, "text": "\\ud800 \xff"}'
+
+    assert OrjsonRequest.parse_json_payload(payload) == {
+        'ok': True,
+        'text': '\ud800 �',
+    }
+
+
+def test_rejects_invalid_json():
+    with pytest.raises(TelegramError):
+        OrjsonRequest.parse_json_payload(b'{not json')
@@ -0,0 +1,106 @@
+"""Tests for the session cache."""
+
+from __future__ import annotations
+
+import pytest
+
+import session_cache as session_cache_module
+from session_cache import SessionCache
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(session_cache_module.time, 'monotonic', fake)
+    return fake
+
+
+@pytest.fixture
+def evicted() -> list[tuple[str, dict]]:
+    return []
+
+
+def make_cache(evicted: list, **kwargs) -> SessionCache:
+    return SessionCache(
+        on_evict=lambda user_id, session: evicted.append((user_id, session)),
+        log_interval=0,
+        **kwargs,
+    )
+
+
+def test_get_returns_cached_session(clock, evicted):
+    cache = make_cache(evicted, ttl_seconds=10)
+    cache.set('1', {'id': 'a'})
+
+    assert cache.get('1') == {'id': 'a'}
+    assert cache.get('2') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_slides_on_every_hit(clock, evicted):
+    cache = make_cache(evicted, ttl_seconds=10)
+    cache.set('1', {'id': 'a'})
+
+    for _ in range(5):
+        clock.now += 8
+        assert cache.get('1') == {'id': 'a'}
+
+    assert evicted == []
+
+
+def test_idle_session_expires_and_is_evicted(clock, evicted):
+    cache = make_cache(evicted, ttl_seconds=10)
+    cache.set('1', {'id': 'a'})
+
+    clock.now += 10
+
+    assert cache.get('1') is None
+    assert evicted == [('1', {'id': 'a'})]
+    assert len(cache) == 0
+
+
+def test_expired_sessions_of_other_users_are_evicted(clock, evicted):
+    cache = make_cache(evicted, ttl_seconds=10)
+    cache.set('1', {'id': 'a'})
+    clock.now += 5
+    cache.set('2', {'id': 'b'})
+    clock.now += 6
+
+    cache.set('3', {'id': 'c'})
+
+    assert evicted == [('1', {'id': 'a'})]
+    assert len(cache) == 2
+
+
+def test_least_recently_used_is_evicted_when_full(clock, evicted):
+    cache = make_cache(evicted, maxsize=2, ttl_seconds=100)
+    cache.set('1', {'id': 'a'})
+    cache.set('2', {'id': 'b'})
+    cache.get('1')
+
+    cache.set('3', {'id': 'c'})
+
+    assert evicted == [('2', {'id': 'b'})]
+    assert cache.get('1') == {'id': 'a'}
+    assert cache.get('3') == {'id': 'c'}
+
+
+def test_invalidate_does_not_notify(clock, evicted):
+    cache = make_cache(evicted, ttl_seconds=10)
+    cache.set('1', {'id': 'a'})
+
+    cache.invalidate('1')
+    cache.invalidate('missing')
+
+    assert cache.get('1') is None
+    assert evicted == []
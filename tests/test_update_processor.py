@@ -0,0 +1,119 @@
+"""Tests for the per-user update processor."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+from telegram import Chat, Message, Update, User
+
+from update_processor import PerUserUpdateProcessor
+
+
+def make_update(update_id: int, user_id: int) -> Update:
+    message = Message(
+        message_id=update_id,
+        date=datetime.now(timezone.utc),
+        chat=Chat(id=user_id, type=Chat.PRIVATE),
+        from_user=User(id=user_id, first_name='Test', is_bot=False),
+        text='hello',
+    )
+    return Update(update_id=update_id, message=message)
+
+
+def test_updates_from_one_user_run_in_order():
+    async def scenario() -> list[int]:
+        processor = PerUserUpdateProcessor(4)
+        order: list[int] = []
+
+        async def handle(update_id: int, delay: float) -> None:
+            await asyncio.sleep(delay)
+            order.append(update_id)
+
+        await asyncio.gather(
+            processor.process_update(make_update(1, 10), handle(1, 0.03)),
+            processor.process_update(make_update(2, 10), handle(2, 0.0)),
+            processor.process_update(make_update(3, 10), handle(3, 0.01)),
+        )
+        return order
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+
+
+def test_waiting_updates_do_not_hold_concurrency_slots():
+    async def scenario() -> list[str]:
+        processor = PerUserUpdateProcessor(2)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def blocked() -> None:
+            await release.wait()
+            order.append('busy')
+
+        async def other_user() -> None:
+            order.append('other')
+            release.set()
+
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(1, 10), blocked()))
+        ]
+        tasks += [
+            asyncio.create_task(processor.process_update(make_update(i, 10), asyncio.sleep(0)))
+            for i in range(2, 6)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(
+            asyncio.create_task(processor.process_update(make_update(6, 20), other_user()))
+        )
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        return order
+
+    assert asyncio.run(scenario()) == ['other', 'busy']
+
+
+def test_locks_are_removed_once_user_is_idle():
+    async def scenario() -> PerUserUpdateProcessor:
+        processor = PerUserUpdateProcessor(4)
+        await asyncio.gather(
+            processor.process_update(make_update(1, 10), asyncio.sleep(0)),
+            processor.process_update(make_update(2, 10), asyncio.sleep(0)),
+            processor.process_update(make_update(3, 20), asyncio.sleep(0)),
+        )
+        return processor
+
+    processor = asyncio.run(scenario())
+
+    assert processor._locks == {}
+    assert processor._pending == {}
+
+
+def test_lock_is_removed_when_processing_fails():
+    async def failing() -> None:
+        raise RuntimeError('boom')
+
+    async def scenario() -> PerUserUpdateProcessor:
+        processor = PerUserUpdateProcessor(4)
+        try:
+            await processor.process_update(make_update(1, 10), failing())
+        except RuntimeError:
+            pass
+        return processor
+
+    processor = asyncio.run(scenario())
+
+    assert processor._locks == {}
+    assert processor._pending == {}
+
+
+def test_updates_without_user_are_processed():
+    async def scenario() -> bool:
+        processor = PerUserUpdateProcessor(1)
+        done = asyncio.Event()
+
+        async def handle() -> None:
+            done.set()
+
+        await processor.process_update(Update(update_id=1), handle())
+        return done.is_set()
+
+    assert asyncio.run(scenario())
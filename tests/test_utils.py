@@ -0,0 +1,89 @@
+"""Tests for agent response handling in utils."""
+
+from __future__ import annotations
+
+import asyncio
+
+from utils import _drain_events, extract_response_text
+
+TOKEN = 'TERMINATE'
+
+
+def text_event(*texts: str) -> dict:
+    return {'content': {'parts': [{'text': text} for text in texts]}}
+
+
+class EventStream:
+    """Generator-like event stream that records how far it was read."""
+
+    def __init__(self, events: list[dict]) -> None:
+        self._events = iter(events)
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self) -> EventStream:
+        return self
+
+    def __next__(self) -> dict:
+        event = next(self._events)
+        self.consumed += 1
+        return event
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_collects_text_without_stop_token():
+    events = [
+        text_event('Hello'),
+        {'content': None},
+        {'actions': {}},
+        {'content': {'parts': [{'function_call': {}}, {'text': ', world'}]}},
+    ]
+
+    assert _drain_events(events) == 'Hello, world'
+
+
+def test_stops_at_token_in_single_part():
+    stream = EventStream([
+        text_event('Bye ', TOKEN),
+        text_event('ignored'),
+    ])
+
+    assert _drain_events(stream, TOKEN) == f'Bye {TOKEN}'
+    assert stream.consumed == 1
+    assert stream.closed
+
+
+def test_stops_at_token_split_across_events():
+    stream = EventStream([
+        text_event('Goodbye TERM'),
+        text_event('INATE'),
+        text_event('ignored'),
+    ])
+
+    assert _drain_events(stream, TOKEN) == f'Goodbye {TOKEN}'
+    assert stream.consumed == 2
+    assert stream.closed
+
+
+def test_stops_at_token_split_across_many_parts():
+    stream = EventStream([text_event(*TOKEN), text_event('ignored')])
+
+    assert _drain_events(stream, TOKEN) == TOKEN
+    assert stream.consumed == 1
+    assert stream.closed
+
+
+def test_reads_whole_stream_when_token_absent():
+    stream = EventStream([text_event('TERM'), text_event('INAL')])
+
+    assert _drain_events(stream, TOKEN) == 'TERMINAL'
+    assert stream.consumed == 2
+    assert not stream.closed
+
+
+def test_extract_response_text_runs_drain():
+    events = [text_event('a'), text_event('b')]
+
+    assert asyncio.run(extract_response_text(events)) == 'ab'
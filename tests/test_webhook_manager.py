@@ -0,0 +1,125 @@
+"""Tests for the webhook manager's webhook info cache."""
+
+from __future__ import annotations
+
+import http.client
+import json
+
+import pytest
+
+import webhook_manager
+
+TOKEN = '123:secret'
+INFO = {'ok': True, 'result': {'url': 'https://example.com/webhook'}}
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / 'cache' / 'webhook.json'
+    monkeypatch.setenv('WEBHOOK_INFO_CACHE_FILE', str(path))
+    monkeypatch.delenv('WEBHOOK_INFO_CACHE_TTL', raising=False)
+    return path
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Replace getWebhookInfo with a queue of responses or exceptions."""
+    responses = []
+    calls = []
+
+    def get_webhook_info(token):
+        calls.append(token)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(webhook_manager, 'get_webhook_info', get_webhook_info)
+    return responses, calls
+
+
+def age_cache(cache_file, seconds):
+    data = json.loads(cache_file.read_text())
+    data['ts'] -= seconds
+    cache_file.write_text(json.dumps(data))
+
+
+def test_cache_round_trip(cache_file):
+    webhook_manager.write_cached_info(TOKEN, INFO)
+
+    ts, body = webhook_manager.read_cached_info(TOKEN)
+
+    assert body == INFO
+    assert webhook_manager.read_cached_info('456:other') is None
+
+
+@pytest.mark.parametrize('content', ['not json', '[]', '{"ts": "x", "bot_id": "123", "body": {}}'])
+def test_malformed_cache_is_ignored(cache_file, content):
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(content)
+
+    assert webhook_manager.read_cached_info(TOKEN) is None
+
+
+def test_fresh_cache_skips_api(cache_file, api):
+    responses, calls = api
+    webhook_manager.write_cached_info(TOKEN, INFO)
+
+    assert webhook_manager.get_webhook_info_cached(TOKEN) == (INFO, False)
+    assert calls == []
+
+
+def test_expired_cache_is_refreshed(cache_file, api):
+    responses, calls = api
+    webhook_manager.write_cached_info(TOKEN, {'ok': True, 'result': {}})
+    age_cache(cache_file, webhook_manager.DEFAULT_CACHE_TTL + 1)
+    responses.append(INFO)
+
+    assert webhook_manager.get_webhook_info_cached(TOKEN) == (INFO, False)
+    assert webhook_manager.read_cached_info(TOKEN)[1] == INFO
+
+
+def test_invalid_ttl_uses_default(cache_file, api, monkeypatch):
+    responses, calls = api
+    monkeypatch.setenv('WEBHOOK_INFO_CACHE_TTL', 'soon')
+    webhook_manager.write_cached_info(TOKEN, INFO)
+
+    assert webhook_manager.get_webhook_info_cached(TOKEN) == (INFO, False)
+    assert calls == []
+
+
+@pytest.mark.parametrize('error', [OSError('down'), http.client.HTTPException('bad')])
+def test_unreachable_api_returns_stale_cache(cache_file, api, error):
+    responses, calls = api
+    webhook_manager.write_cached_info(TOKEN, INFO)
+    age_cache(cache_file, webhook_manager.DEFAULT_CACHE_TTL + 1)
+    responses.append(error)
+
+    assert webhook_manager.get_webhook_info_cached(TOKEN) == (INFO, True)
+
+
+def test_unreachable_api_without_cache_raises(cache_file, api):
+    responses, calls = api
+    responses.append(OSError('down'))
+
+    with pytest.raises(OSError):
+        webhook_manager.get_webhook_info_cached(TOKEN)
+
+
+def test_error_response_returns_stale_cache(cache_file, api):
+    responses, calls = api
+    webhook_manager.write_cached_info(TOKEN, INFO)
+    age_cache(cache_file, webhook_manager.DEFAULT_CACHE_TTL + 1)
+    responses.append({'ok': False, 'error_code': 429, 'description': 'Too Many Requests'})
+
+    assert webhook_manager.get_webhook_info_cached(TOKEN) == (INFO, True)
+    assert webhook_manager.read_cached_info(TOKEN)[1] == INFO
+
+
+def test_error_response_without_cache_is_not_cached(cache_file, api):
+    responses, calls = api
+    error = {'ok': False, 'error_code': 429, 'description': 'Too Many Requests'}
+    responses.append(error)
+
+    assert webhook_manager.get_webhook_info_cached(TOKEN) == (error, False)
+    assert webhook_manager.read_cached_info(TOKEN) is None